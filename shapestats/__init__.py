@@ -2,3 +2,4 @@ __version__ = '0.2.4'
 from .compactness import *
 from .maxbc import maximum_contained_circle
 from .minbc import minimum_bounding_circle
+from .aggregate import HullLevel
@@ -1,8 +1,9 @@
 import numpy as np
 from libpysal.cg.shapes import Polygon, asShape
+from . import _geodesic as _geo
 
 
-def second_moa(chain):
+def second_moa(chain, geodesic=False):
     """
     Using equation listed on en.wikipedia.org/Second_Moment_of_area, the second
     moment of area is actually the cross-moment of area between the X and Y
@@ -22,7 +23,17 @@ def second_moa(chain):
 
     and is *not* the mass moment of inertia, a property of the distribution of
     mass around a shape.
+
+    If geodesic, the chain is taken to be in (lon, lat). Since a moment about
+    the (lon, lat) origin means nothing for real data, the chain is instead
+    projected to a local equal-area projection about its centroid, and the
+    polar moment of area about that centroid, I_x + I_y, is returned in
+    meters^4. The cross-moment I_xy is not used here, since it vanishes about
+    the centroid for any shape that is symmetric along either axis.
     """
+    if geodesic:
+        center = _geo.centroid(chain)
+        return _polar_moa(_geo.project_geom(chain, center, kind='laea'))
     chain = asShape(chain)
     outer_I = 0
     if chain.holes == [[]]:
@@ -41,3 +52,22 @@ def second_moa(chain):
             moment += first * second
         outer_I += moment
     return (1 / float(24)) * (np.abs(outer_I) - np.abs(hole_I))
+
+def _polar_moa(poly):
+    """
+    The polar second moment of area, I_x + I_y, of a shapely (multi)polygon
+    about its centroid, using the same polygon integrals as second_moa:
+
+    I_x = (1/12)\sum (x_iy_{i+1} - x_{i+1}y_i)(y_i^2 + y_iy_{i+1} + y_{i+1}^2)
+    I_y = (1/12)\sum (x_iy_{i+1} - x_{i+1}y_i)(x_i^2 + x_ix_{i+1} + x_{i+1}^2)
+    """
+    c = np.array([poly.centroid.x, poly.centroid.y])
+    moment = 0
+    for ring, is_hole in _geo._rings(poly):
+        x, y = (ring - c).T
+        cross = x[:-1] * y[1:] - x[1:] * y[:-1]
+        ix = np.sum(cross * (y[:-1]**2 + y[:-1] * y[1:] + y[1:]**2))
+        iy = np.sum(cross * (x[:-1]**2 + x[:-1] * x[1:] + x[1:]**2))
+        ring_I = np.abs(ix + iy) / 12
+        moment += -ring_I if is_hole else ring_I
+    return moment
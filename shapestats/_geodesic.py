@@ -0,0 +1,336 @@
+"""
+Vectorized kernels for measuring unprojected (longitude, latitude) shapes.
+
+Coordinates are taken in decimal degrees as (lon, lat) and all lengths are
+returned in meters on the WGS84 ellipsoid. Areas are computed exactly on the
+authalic (equal-area) sphere of the ellipsoid, and distances use Lambert's
+formula for ellipsoidal geodesics, which is closed-form and accurate to a few
+meters over thousands of kilometers. Every kernel operates on whole
+coordinate arrays at once, so there is no per-vertex python call.
+"""
+import numpy as np
+from scipy.spatial import ConvexHull
+from libpysal.weights._contW_lists import _get_verts as _get_pointset
+from shapely.geometry import Polygon, shape as to_shapely_geom
+from shapely.ops import transform as _transform
+
+from .minbc import minimum_bounding_circle as _mbc
+
+# WGS84 semi-major axis & flattening
+A = 6378137.0
+F = 1 / 298.257223563
+_E2 = F * (2 - F)
+_E = np.sqrt(_E2)
+
+
+def _q(sinphi):
+    """
+    The q function of Snyder (1987), eq 3-12, used to build authalic latitudes
+    """
+    esin = _E * sinphi
+    return (1 - _E2) * (sinphi / (1 - esin**2)
+                        - (1 / (2 * _E)) * np.log((1 - esin) / (1 + esin)))
+
+_QP = _q(1.0)
+
+#: radius of the sphere with the same surface area as the ellipsoid
+R_AUTHALIC = A * np.sqrt(_QP / 2)
+
+
+def authalic_latitude(lat):
+    """
+    Convert geodetic latitudes (in radians) to authalic latitudes (in radians)
+    """
+    return np.arcsin(np.clip(_q(np.sin(lat)) / _QP, -1, 1))
+
+
+def geodetic_latitude(xi):
+    """
+    Convert authalic latitudes (in radians) back to geodetic latitudes (in
+    radians), using the series in Snyder (1987), eq 3-18
+    """
+    e4, e6 = _E2**2, _E2**3
+    return (xi
+            + (_E2 / 3 + 31 * e4 / 180 + 517 * e6 / 5040) * np.sin(2 * xi)
+            + (23 * e4 / 360 + 251 * e6 / 3780) * np.sin(4 * xi)
+            + (761 * e6 / 45360) * np.sin(6 * xi))
+
+
+def _as_lonlat(points):
+    """
+    Convert a point or array of (lon, lat) points in degrees to radians
+    """
+    points = np.radians(np.asarray(points, dtype=float))
+    return points[..., 0], points[..., 1]
+
+
+def _central_angle(lon1, lat1, lon2, lat2):
+    """
+    Haversine central angle between two arrays of points, in radians
+    """
+    h = (np.sin((lat2 - lat1) / 2)**2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2)
+    return 2 * np.arcsin(np.sqrt(np.clip(h, 0, 1)))
+
+
+def distance(p, q):
+    """
+    Ellipsoidal distance between (lon, lat) points p and q, in meters.
+
+    p and q may be single points or (n,2) arrays of points, and are broadcast
+    against one another. This uses Lambert's formula, which corrects the
+    great-circle distance between the reduced latitudes of each point for
+    the flattening of the ellipsoid.
+    """
+    lon1, lat1 = _as_lonlat(p)
+    lon2, lat2 = _as_lonlat(q)
+    beta1 = np.arctan((1 - F) * np.tan(lat1))
+    beta2 = np.arctan((1 - F) * np.tan(lat2))
+    sigma = _central_angle(lon1, beta1, lon2, beta2)
+    P = (beta1 + beta2) / 2
+    Q = (beta2 - beta1) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        X = ((sigma - np.sin(sigma)) * np.sin(P)**2 * np.cos(Q)**2
+             / np.cos(sigma / 2)**2)
+        Y = ((sigma + np.sin(sigma)) * np.cos(P)**2 * np.sin(Q)**2
+             / np.sin(sigma / 2)**2)
+    correction = np.where(sigma > 0, X + Y, 0)
+    return A * (sigma - F / 2 * correction)
+
+
+def pdist(points):
+    """
+    Condensed pairwise ellipsoidal distances between (lon, lat) points, in the
+    same order as scipy.spatial.distance.pdist.
+    """
+    points = np.asarray(points, dtype=float)
+    i, j = np.triu_indices(len(points), k=1)
+    return distance(points[i], points[j])
+
+
+def _rings(poly):
+    """
+    Yield (coordinates, is_hole) for every ring in a (multi)polygon
+    """
+    poly = to_shapely_geom(poly)
+    for part in getattr(poly, 'geoms', [poly]):
+        yield np.asarray(part.exterior.coords), False
+        for hole in part.interiors:
+            yield np.asarray(hole.coords), True
+
+
+def _ring_area(coords):
+    """
+    Unsigned area of a closed ring of (lon, lat) coordinates on the authalic
+    sphere, in square meters. Edges are taken as great-circle arcs.
+    """
+    lon, lat = _as_lonlat(coords)
+    t = np.tan(authalic_latitude(lat) / 2)
+    dlon = np.diff(lon)
+    dlon = (dlon + np.pi) % (2 * np.pi) - np.pi
+    excess = 2 * np.arctan2(np.tan(dlon / 2) * (t[:-1] + t[1:]),
+                            1 + t[:-1] * t[1:])
+    return np.abs(excess.sum()) * R_AUTHALIC**2
+
+
+def _ring_length(coords):
+    """
+    Ellipsoidal length of a chain of (lon, lat) coordinates, in meters
+    """
+    coords = np.asarray(coords, dtype=float)
+    return distance(coords[:-1], coords[1:]).sum()
+
+
+def area(poly):
+    """
+    Area of a (multi)polygon in (lon, lat) coordinates, in square meters
+    """
+    return np.sum([-_ring_area(ring) if is_hole else _ring_area(ring)
+                   for ring, is_hole in _rings(poly)])
+
+
+def perimeter(poly):
+    """
+    Length of the boundary of a (multi)polygon in (lon, lat) coordinates, in
+    meters. Like shapely's boundary length, this includes the holes.
+    """
+    return np.sum([_ring_length(ring) for ring, _ in _rings(poly)])
+
+
+## ---- Circles on the authalic sphere ---- ##
+
+def cap_area(radius):
+    """
+    Area of a spherical cap with geodesic radius given in meters
+    """
+    return 2 * np.pi * R_AUTHALIC**2 * (1 - np.cos(radius / R_AUTHALIC))
+
+
+def cap_perimeter(radius):
+    """
+    Perimeter of a spherical cap with geodesic radius given in meters
+    """
+    return 2 * np.pi * R_AUTHALIC * np.sin(radius / R_AUTHALIC)
+
+
+def cap_radius(area):
+    """
+    Geodesic radius of the spherical cap with the given area
+    """
+    return R_AUTHALIC * np.arccos(1 - area / (2 * np.pi * R_AUTHALIC**2))
+
+
+def cap_radius_from_perimeter(perimeter):
+    """
+    Geodesic radius of the (smaller) spherical cap with the given perimeter
+    """
+    ratio = np.clip(perimeter / (2 * np.pi * R_AUTHALIC), -1, 1)
+    return R_AUTHALIC * np.arcsin(ratio)
+
+
+## ---- Azimuthal projections about a center point ---- ##
+
+# scale factors, k(c), for each azimuthal projection at central angle c, and
+# the inverse map from projected radius (over R) back to the central angle.
+_AZIMUTHAL = dict(aeqd=(lambda c: np.where(c > 0, c / np.sin(c), 1.0),
+                        lambda rho: rho),
+                  laea=(lambda c: np.sqrt(2 / (1 + np.cos(c))),
+                        lambda rho: 2 * np.arcsin(np.clip(rho / 2, -1, 1))),
+                  gnom=(lambda c: 1 / np.cos(c),
+                        lambda rho: np.arctan(rho)))
+
+
+def project(points, center, kind='aeqd', radius=R_AUTHALIC):
+    """
+    Project an array of (lon, lat) points onto a spherical azimuthal
+    projection about center, yielding an (n,2) array of planar coordinates in
+    meters.
+
+    Arguments
+    ---------
+    kind    :   str
+                one of 'aeqd' (equidistant, distances to the center are
+                preserved), 'laea' (equal-area on the ellipsoid, using
+                authalic latitudes), or 'gnom' (gnomonic, great circles map to
+                straight lines).
+    """
+    scale, _ = _AZIMUTHAL[kind]
+    lon, lat = _as_lonlat(points)
+    lon0, lat0 = _as_lonlat(center)
+    if kind == 'laea':
+        lat, lat0 = authalic_latitude(lat), authalic_latitude(lat0)
+    dlon = lon - lon0
+    cosc = (np.sin(lat0) * np.sin(lat)
+            + np.cos(lat0) * np.cos(lat) * np.cos(dlon))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = radius * scale(np.arccos(np.clip(cosc, -1, 1)))
+    x = k * np.cos(lat) * np.sin(dlon)
+    y = k * (np.cos(lat0) * np.sin(lat)
+             - np.sin(lat0) * np.cos(lat) * np.cos(dlon))
+    return np.column_stack((x, y))
+
+
+def unproject(points, center, kind='aeqd', radius=R_AUTHALIC):
+    """
+    Invert project(), returning an (n,2) array of (lon, lat) points
+    """
+    _, angle = _AZIMUTHAL[kind]
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    x, y = points[:, 0], points[:, 1]
+    lon0, lat0 = _as_lonlat(center)
+    if kind == 'laea':
+        lat0 = authalic_latitude(lat0)
+    rho = np.hypot(x, y)
+    c = angle(rho / radius)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ysc = np.where(rho > 0, y * np.sin(c) / rho, 0)
+    lat = np.arcsin(np.cos(c) * np.sin(lat0) + ysc * np.cos(lat0))
+    lon = lon0 + np.arctan2(x * np.sin(c),
+                            rho * np.cos(lat0) * np.cos(c)
+                            - y * np.sin(lat0) * np.sin(c))
+    lon = (lon + np.pi) % (2 * np.pi) - np.pi
+    if kind == 'laea':
+        lat = geodetic_latitude(lat)
+    return np.degrees(np.column_stack((lon, lat)))
+
+
+def project_geom(poly, center, kind='laea'):
+    """
+    Project a shapely geometry in (lon, lat) about center, as in project()
+    """
+    def _forward(x, y, z=None):
+        xy = project(np.column_stack((x, y)), center, kind=kind)
+        return xy[:, 0], xy[:, 1]
+    return _transform(_forward, to_shapely_geom(poly))
+
+
+## ---- Derived geometries ---- ##
+
+def _center(poly):
+    """
+    Representative (lon, lat) center of a shape used to anchor projections,
+    taken as the spherical mean of its vertices so that shapes crossing the
+    antimeridian are anchored on the correct side of the globe.
+    """
+    # drop the repeated closing vertex of each ring, which would bias the mean
+    lon, lat = _as_lonlat(np.unique(np.asarray(_get_pointset(poly)), axis=0))
+    x, y, z = (np.mean(np.cos(lat) * np.cos(lon)),
+               np.mean(np.cos(lat) * np.sin(lon)),
+               np.mean(np.sin(lat)))
+    return (np.degrees(np.arctan2(y, x)),
+            np.degrees(np.arctan2(z, np.hypot(x, y))))
+
+
+def centroid(poly):
+    """
+    Area-weighted centroid of a (lon, lat) polygon, found in a local
+    equal-area projection and returned as a (lon, lat) tuple.
+    """
+    center = _center(poly)
+    local = project_geom(poly, center, kind='laea').centroid
+    return tuple(unproject((local.x, local.y), center, kind='laea')[0])
+
+
+def convex_hull(poly):
+    """
+    Geodesic convex hull of a (lon, lat) shape, as a shapely polygon in
+    (lon, lat). The hull is found in a gnomonic projection about the shape,
+    where geodesics are straight lines, so the shape must fit within a
+    hemisphere.
+    """
+    center = _center(poly)
+    points = np.asarray(_get_pointset(poly), dtype=float)
+    lon, lat = _as_lonlat(points)
+    lon0, lat0 = _as_lonlat(center)
+    if np.any(_central_angle(lon, lat, lon0, lat0) >= np.pi / 2):
+        raise ValueError('geodesic convex hulls require shapes that fit within'
+                         ' a hemisphere, but this shape has vertices 90 degrees'
+                         ' or more from its center at {}'.format(center))
+    hull = ConvexHull(project(points, center, kind='gnom'))
+    return Polygon(points[hull.vertices])
+
+
+def minimum_bounding_circle(poly):
+    """
+    Approximate minimum bounding circle of a (lon, lat) shape, as a spherical
+    cap on the authalic sphere. The center is found by applying Skyum's
+    algorithm to the shape's geodesic hull in an azimuthal equidistant
+    projection, which is not exactly the minimal center away from the
+    projection's origin. The radius is then the largest great-circle distance
+    on the authalic sphere from that center to the hull, so the cap always
+    bounds the shape, is consistent with cap_area(), and is at least as large
+    as the true minimum bounding cap.
+
+    Returns
+    -------
+    (radius, (center_lon, center_lat)), where radius is in meters
+    """
+    hull = np.asarray(convex_hull(poly).exterior.coords)[:-1]
+    center = _center(poly)
+    _, planar_center = _mbc(project(hull, center, kind='aeqd'))
+    mbc_center = unproject(planar_center, center, kind='aeqd')[0]
+    lon, lat = _as_lonlat(hull)
+    lon0, lat0 = _as_lonlat(mbc_center)
+    angles = _central_angle(lon, authalic_latitude(lat),
+                            lon0, authalic_latitude(lat0))
+    return R_AUTHALIC * angles.max(), tuple(mbc_center)
@@ -2,6 +2,7 @@ import libpysal.cg as cg
 import scipy.spatial.distance as d
 import numpy as np
 from libpysal.weights._contW_lists import _get_verts as _get_pointset
+from . import _geodesic as _geo
 
 def all_angles(chain):
     """
@@ -18,7 +19,7 @@ def all_angles(chain):
         parts.append(angles)
     return parts
 
-def pairwise_lw(chain):
+def pairwise_lw(chain, geodesic=False):
     """
     Construct the diameter and width of a polygon, as defined as the longest and
     shortest pairwise distances between a polygon's vertices. 
@@ -34,15 +35,21 @@ def pairwise_lw(chain):
     ((p1, p2), d, (p1, p2, p3), d)
     
     Thus, you need to be careful with automated unpacking.
+
+    If geodesic, the chain is taken to be in (lon, lat) and distances are
+    ellipsoidal, in meters.
     """
     ptset = _get_pointset(chain)
-    pwds = d.pdist(ptset)
+    if geodesic:
+        pwds = _geo.pdist(ptset)
+    else:
+        pwds = d.pdist(ptset)
     sqf = d.squareform(pwds)
     minval = pwds[np.nonzero(pwds)].min() #have to account for zero selfdist
     amin, amax = np.where(sqf == minval), np.where(sqf == pwds.max())
     return amin, sqf[amin], amax, sqf[amax]
 
-def unique_lw(chain):
+def unique_lw(chain, geodesic=False):
     """
     Return a unique longest and shortest length for points on a chain's
     diameter. 
@@ -60,7 +67,7 @@ def unique_lw(chain):
     distance point pair, and min_dist/max_dist are the smallest and largest
     distances between points in the polygon..
     """
-    mins, mindists, maxes, maxdists = pairwise_lw(chain)
+    mins, mindists, maxes, maxdists = pairwise_lw(chain, geodesic=geodesic)
     assert np.all(mindists == mindists.min())
     mindists = mindists.min() #take smallest value, should be all the same
     mins = mins[0][0], mins[1][0] #grab the first from the index pairs
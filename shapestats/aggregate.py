@@ -0,0 +1,194 @@
+"""
+Hull- and circle-based measures over nested levels of shapes.
+
+The convex hull of a union of shapes is the convex hull of their hulls, and
+the minimum bounding circle, bounding box, and diameter of a shape all depend
+only on its hull. So, once the hulls of the smallest units are known, every
+coarser level can be scored by merging child hulls, without ever unioning the
+underlying geometries.
+"""
+from __future__ import division
+from math import pi as _PI
+from libpysal.weights._contW_lists import _get_verts as _get_pointset
+from shapely.geometry import asShape as to_shapely_geom
+from scipy.spatial import distance as _dst
+import numpy as np
+
+from .minbc import hull as _hull, minimum_bounding_circle as _mbc
+
+__all__ = ['HullLevel']
+
+
+def _hull_area(hull):
+    """
+    Area of a counterclockwise hull using the shoelace formula
+    """
+    x, y = hull[:, 0], hull[:, 1]
+    return .5 * np.abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _hull_perimeter(hull):
+    """
+    Perimeter of a hull, including the closing edge
+    """
+    return np.hypot(*(np.roll(hull, -1, axis=0) - hull).T).sum()
+
+
+class HullLevel(object):
+    """
+    One level of a hierarchy of shapes, stored as the convex hull, area, and
+    perimeter of each unit. Coarser levels are built with aggregate(), which
+    merges child hulls rather than unioning geometries, so that a multi-level
+    report costs about as much as the total size of the hulls involved.
+
+    Arguments
+    ---------
+    hulls       :   list of numpy.ndarray (h,2)
+                    counterclockwise hull vertices for each unit
+    areas       :   numpy.ndarray (n,)
+                    area of each unit
+    perimeters  :   numpy.ndarray (n,)
+                    perimeter of each unit. May be nan where unknown, in which
+                    case boundary_amplitude is nan for that unit.
+    index       :   numpy.ndarray (n,)
+                    labels for each unit. Defaults to 0, 1, ..., n-1.
+
+    Example
+    -------
+    >>> blocks = HullLevel.from_shapes(df.geometry)
+    >>> tracts = blocks.aggregate(df.tract)
+    >>> states = tracts.aggregate(tract_to_state[tracts.index])
+    >>> states.reock()
+    """
+    def __init__(self, hulls, areas, perimeters=None, index=None):
+        self.hulls = list(hulls)
+        self.areas = np.asarray(areas, dtype=float)
+        if perimeters is None:
+            perimeters = np.full(len(self.hulls), np.nan)
+        self.perimeters = np.asarray(perimeters, dtype=float)
+        if index is None:
+            index = np.arange(len(self.hulls))
+        self.index = np.asarray(index)
+        self._circles = None
+
+    @classmethod
+    def from_shapes(cls, shapes, index=None):
+        """
+        Build the finest level of a hierarchy from a collection of shapes.
+        This is the only step that touches full shape boundaries.
+        """
+        shapes = [to_shapely_geom(shape) for shape in shapes]
+        hulls = [_hull(_get_pointset(shape)) for shape in shapes]
+        areas = [shape.area for shape in shapes]
+        perimeters = [shape.boundary.length for shape in shapes]
+        return cls(hulls, areas, perimeters, index=index)
+
+    def __len__(self):
+        return len(self.hulls)
+
+    def aggregate(self, labels, perimeters=None):
+        """
+        Build the next level up by grouping units that share a label.
+
+        The units in each group are assumed not to overlap, so the parent's
+        area is the sum of its children's areas. The perimeter of a parent
+        cannot be found from its children's hulls, so it is nan unless given.
+
+        Arguments
+        ---------
+        labels      :   array-like (n,)
+                        the parent of each unit in this level
+        perimeters  :   array-like (k,)
+                        perimeters of the parents, ordered like the sorted
+                        unique labels
+
+        Returns
+        -------
+        a HullLevel whose index is the sorted unique labels
+        """
+        labels = np.asarray(labels)
+        if len(labels) != len(self):
+            raise ValueError('labels must have one entry per unit, but {} were'
+                             ' given for {} units'.format(len(labels), len(self)))
+        index, parents = np.unique(labels, return_inverse=True)
+        parents = parents.ravel()
+        sizes = np.bincount(parents, minlength=len(index))
+        groups = np.split(np.argsort(parents, kind='mergesort'),
+                          np.cumsum(sizes)[:-1])
+        hulls = [_hull(np.vstack([self.hulls[child] for child in group]))
+                 for group in groups]
+        if perimeters is not None and len(perimeters) != len(index):
+            raise ValueError('perimeters must have one entry per parent, but {}'
+                             ' were given for {} parents'
+                             .format(len(perimeters), len(index)))
+        areas = np.bincount(parents, weights=self.areas, minlength=len(index))
+        return type(self)(hulls, areas, perimeters, index=index)
+
+    ## ---- hull-derived geometry ---- ##
+
+    def hull_areas(self):
+        """
+        The area of each unit's convex hull
+        """
+        return np.array([_hull_area(hull) for hull in self.hulls])
+
+    def hull_perimeters(self):
+        """
+        The perimeter of each unit's convex hull
+        """
+        return np.array([_hull_perimeter(hull) for hull in self.hulls])
+
+    def bounding_boxes(self):
+        """
+        Returns an (n,4) array of (minx, miny, maxx, maxy) for each unit
+        """
+        return np.array([np.hstack((hull.min(axis=0), hull.max(axis=0)))
+                         for hull in self.hulls])
+
+    def diameters(self):
+        """
+        The largest distance between any two points in each unit, which is
+        always attained between two hull vertices
+        """
+        return np.array([_dst.pdist(hull).max() for hull in self.hulls])
+
+    def minimum_bounding_circles(self):
+        """
+        Returns a list of (radius, (center_x, center_y)) for each unit. These
+        are computed from the cached hulls once, and then reused.
+        """
+        if self._circles is None:
+            self._circles = [_mbc(hull) for hull in self.hulls]
+        return self._circles
+
+    ## ---- measures ---- ##
+
+    def convex_hull(self):
+        """
+        ratio of the convex hull area to the area of each unit, as in
+        shapestats.convex_hull
+        """
+        return self.areas / self.hull_areas()
+
+    def boundary_amplitude(self):
+        """
+        ratio of the perimeter of each unit's convex hull to the perimeter of
+        the unit, as in shapestats.boundary_amplitude
+        """
+        return self.hull_perimeters() / self.perimeters
+
+    def reock(self):
+        """
+        ratio of the area of each unit to the area of its minimum bounding
+        circle, as in shapestats.reock
+        """
+        radii = np.array([radius for radius, _ in self.minimum_bounding_circles()])
+        return self.areas / (_PI * radii**2)
+
+    def flaherty_crumplin_radius(self):
+        """
+        ratio of the radius of the equi-areal circle to the radius of the
+        minimum bounding circle, as in shapestats.flaherty_crumplin_radius
+        """
+        radii = np.array([radius for radius, _ in self.minimum_bounding_circles()])
+        return np.sqrt(self.areas / _PI) / radii
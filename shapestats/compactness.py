@@ -6,6 +6,7 @@ from scipy.spatial import distance as _dst
 import numpy as np
 
 from . import _util as _u
+from . import _geodesic as _geo
 from .minbc import minimum_bounding_circle as _mbc
 from .maxbc import maximum_contained_circle as _mcc
 from ._amoments import second_moa
@@ -18,7 +19,7 @@ __all__ = ['ipq', 'iaq', 'convex_hull', 'boundary_amplitude', 'reock',
 
 ### ---- Altman's PA/A measures ---- ##
 
-def ipq(poly):
+def ipq(poly, geodesic=False):
     """
     The Isoperimetric quotient, defined as the ratio of a poly's area to the 
     area of the equi-perimeter circle. 
@@ -46,43 +47,72 @@ def ipq(poly):
     implying finally that the IPQ is:
 
     pp = (a_d) / (a_c) = (a_d) / ((p_d / (2*\pi))^2 * \pi) = (a_d) / (p_d**2 / (4\PI))
+
+    If geodesic, poly is taken to be in (lon, lat), and the constructed circle
+    is the spherical cap with the same ellipsoidal perimeter as the district.
     """
+    if geodesic:
+        r = _geo.cap_radius_from_perimeter(_geo.perimeter(poly))
+        return _geo.area(poly) / _geo.cap_area(r)
     return (4 * _PI * poly.area) / (poly.boundary.length**2)
 
-def convex_hull(poly):
+def convex_hull(poly, geodesic=False):
     """
     ratio of the convex hull area to the area of the shape itself
 
     Altman's A_3 measure, from Neimi et al 1991. 
+
+    If geodesic, poly is taken to be in (lon, lat), and the geodesic convex
+    hull is used.
     """
+    if geodesic:
+        return _geo.area(poly) / _geo.area(_geo.convex_hull(poly))
     chull = to_shapely_geom(poly).convex_hull
     return poly.area / chull.area
 
-def boundary_amplitude(poly):
+def boundary_amplitude(poly, geodesic=False):
     """
     The boundary amplitude is the ratio of the perimeter of a shape's
     convex hull to the perimeter of the shape itself
+
+    If geodesic, poly is taken to be in (lon, lat), and the geodesic convex
+    hull is used.
     """
+    if geodesic:
+        chull = _geo.convex_hull(poly)
+        return _geo.perimeter(chull) / _geo.perimeter(poly)
     chull = to_shapely_geom(poly).convex_hull
     return chull.boundary.length/poly.boundary.length
 
-def iaq(poly):
+def iaq(poly, geodesic=False):
     """
     The Isoareal quotient, defined as the ratio of a poly's perimeter to the
     perimeter of the equi-areal circle
 
     Altman's PA_3 measure, and proportional to the PA_4 measure 
+
+    If geodesic, poly is taken to be in (lon, lat), and the equi-areal circle
+    is the spherical cap with the same ellipsoidal area as the poly.
     """
+    if geodesic:
+        r = _geo.cap_radius(_geo.area(poly))
+        return _geo.cap_perimeter(r) / _geo.perimeter(poly)
     return (2 * _PI * np.sqrt(poly.area/_PI)) / poly.boundary.length
 
-def reock(poly):
+def reock(poly, geodesic=False):
     """
     The Reock compactness measure, defined by the ratio of areas between the
     minimum bounding/containing circle of a shape and the shape itself. 
 
     Measure A1 in Altman's thesis, cited for Frolov (1974), but earlier from Reock
     (1963)
+
+    If geodesic, poly is taken to be in (lon, lat), and the minimum bounding
+    circle is a spherical cap.
     """
+    if geodesic:
+        radius, _ = _geo.minimum_bounding_circle(poly)
+        return _geo.area(poly) / _geo.cap_area(radius)
     pointset = _get_pointset(poly) 
     radius, (cx, cy) = _mbc(pointset)
     return poly.area / (_PI * radius ** 2)
@@ -97,25 +127,34 @@ def contained_circle_aq(poly):
     radius, (cx, cy) = _mcc(pointset)
     return poly.area / (_PI * radius ** 2)
 
-def nmi(poly):
+def nmi(poly, geodesic=False):
     """
     Computes the Normalized Moment of Inertia from Li et al (2013), recognizing
     that it is the relationship between the area of a shape squared divided by
     its second moment of area. 
+
+    If geodesic, poly is taken to be in (lon, lat).
     """
+    if geodesic:
+        return _geo.area(poly)**2 / (2 * second_moa(poly, geodesic=True) * _PI)
     return poly.area**2 / (2 * second_moa(poly) * _PI)
 
-def moa_ratio(poly):
+def moa_ratio(poly, geodesic=False):
     """
     Computes the ratio of the second moment of area (like Li et al (2013)) to
     the moment of area of a circle with the same area. 
+
+    If geodesic, poly is taken to be in (lon, lat).
     """
-    r = poly.boundary.length / (2 * _PI)
-    return (_PI * .5 * r**4) / second_moa(poly)
+    if geodesic:
+        r = _geo.perimeter(poly) / (2 * _PI)
+    else:
+        r = poly.boundary.length / (2 * _PI)
+    return (_PI * .5 * r**4) / second_moa(poly, geodesic=geodesic)
 
 ## ---- Altman's OS Measures ---- ##
 
-def moment_of_inertia(poly, dmetric=_dst.euclidean):
+def moment_of_inertia(poly, dmetric=_dst.euclidean, geodesic=False):
     """
     Computes the moment of inertia of the poly. 
 
@@ -130,17 +169,29 @@ def moment_of_inertia(poly, dmetric=_dst.euclidean):
     
     Altman's OS_1 measure, cited in Boyce and Clark (1964), also used in Weaver
     and Hess (1963).
+
+    If geodesic, poly is taken to be in (lon, lat), dmetric is ignored, and
+    the ellipsoidal distances to the centroid are computed all at once.
     """
     pointset = _get_pointset(poly) 
+    if geodesic:
+        dists = _geo.distance(pointset, _geo.centroid(poly))**2
+        return _geo.area(poly) / np.sqrt(2 * np.sum(dists))
     dists = [dmetric(pt, poly.centroid)**2 for pt in pointset]
     return poly.area / np.sqrt(2 * np.sum(dists))
 
-def flaherty_crumplin_radius(poly):
+def flaherty_crumplin_radius(poly, geodesic=False):
     """
     The Flaherty & Crumplin (1992) index, OS_3 in Altman's thesis. 
     
     The ratio of the radius of the equi-areal circle to the radius of the MBC
+
+    If geodesic, poly is taken to be in (lon, lat), and both circles are
+    spherical caps.
     """
+    if geodesic:
+        r_mbc, _ = _geo.minimum_bounding_circle(poly)
+        return _geo.cap_radius(_geo.area(poly)) / r_mbc
     pointset = _get_pointset(poly) 
     r_eac = np.sqrt(poly.area/_PI)
     r_mbc, _ = _mbc(pointset)
@@ -165,14 +216,16 @@ def taylor_reflexive(poly):
 
 ## ---- Altman's Length-Width Measures ---- ##
 
-def flaherty_crumplin_lw(poly):
+def flaherty_crumplin_lw(poly, geodesic=False):
     """
     The Flaherty & Crumplin (1992) length-width measure, stated as measure LW_7
     in Altman's thesis. 
 
     It is given as the ratio between the minimum and maximum shape diameter. 
+
+    If geodesic, poly is taken to be in (lon, lat).
     """
-    _, minlen, _, maxlen = _u.unique_lw(poly)
+    _, minlen, _, maxlen = _u.unique_lw(poly, geodesic=geodesic)
     return minlen / maxlen
 
 def eig_seitzinger(poly):
@@ -194,14 +247,14 @@ def eig_seitzinger(poly):
 
 ## ---- Alternative Names ---- ##
 
-def polsby_popper(poly):
+def polsby_popper(poly, geodesic=False):
     """
     Alternative name for the Isoperimetric Quotient
     """
-    return ipq(poly)
+    return ipq(poly, geodesic=geodesic)
 
-def schwartzberg(poly):
+def schwartzberg(poly, geodesic=False):
     """
     Alterantive name for the Isoareal Quotient
     """
-    return iaq(poly)
+    return iaq(poly, geodesic=geodesic)
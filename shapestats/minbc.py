@@ -25,8 +25,7 @@ def minimum_bounding_circle(points):
     if was_polygon:
         from .compactness import _get_pointset
         points = _get_pointset(points)
-    chull = ConvexHull(points)
-    points = np.asarray(points)[chull.vertices]
+    points = hull(points)
     points = points[::-1] #shift from ccw to cw
     points = list(map(tuple, points))
     POINTS = copy.deepcopy(points)
@@ -53,6 +52,16 @@ def minimum_bounding_circle(points):
             return circles[lexmax]
         i+=1
 
+def hull(points):
+    """
+    The vertices of the convex hull of a point cloud, in counterclockwise
+    order, as an (h,2) array. This is the hull the minimum bounding circle is
+    built from, so passing its output back to minimum_bounding_circle avoids
+    touching the full point cloud again.
+    """
+    points = np.asarray(points)
+    return points[ConvexHull(points).vertices]
+
 def _mbc_animation(points, plotname=False, buffer_=.2):
     """
     Implements Skyum (1990)'s algorithm for the minimum bounding circle in R^2. 
@@ -0,0 +1,45 @@
+from shapely import geometry, ops
+from numpy import testing
+import numpy as np
+from ..aggregate import HullLevel
+from ..compactness import *
+from .._util import unique_lw
+from .test_measures import shape, ATOL
+
+# the test shape cut into four pieces, assigned to two halves
+boxes = [geometry.box(0, 0, .625, .5), geometry.box(.625, 0, 1.25, .5),
+         geometry.box(0, .5, .625, 1), geometry.box(.625, .5, 1.25, 1)]
+pieces = [shape.intersection(box) for box in boxes]
+halves = ['bottom', 'bottom', 'top', 'top']
+
+def test_from_shapes():
+    level = HullLevel.from_shapes(pieces)
+    testing.assert_allclose(level.convex_hull(),
+                            [convex_hull(piece) for piece in pieces], atol=ATOL)
+    testing.assert_allclose(level.reock(),
+                            [reock(piece) for piece in pieces], atol=ATOL)
+
+def test_aggregate():
+    level = HullLevel.from_shapes(pieces).aggregate(halves)
+    testing.assert_array_equal(level.index, ['bottom', 'top'])
+    merged = [ops.unary_union(pieces[:2]), ops.unary_union(pieces[2:])]
+    testing.assert_allclose(level.areas, [m.area for m in merged], atol=ATOL)
+    testing.assert_allclose(level.flaherty_crumplin_radius(),
+                            [flaherty_crumplin_radius(m) for m in merged],
+                            atol=ATOL)
+    assert np.isnan(level.boundary_amplitude()).all()
+
+def test_aggregate_to_top():
+    level = HullLevel.from_shapes(pieces).aggregate(halves)
+    level = level.aggregate([0, 0], perimeters=[shape.boundary.length])
+    testing.assert_allclose(level.convex_hull(), .7, atol=ATOL)
+    testing.assert_allclose(level.boundary_amplitude(), .844527, atol=ATOL)
+    testing.assert_allclose(level.reock(), .434764, atol=ATOL)
+    testing.assert_allclose(level.flaherty_crumplin_radius(), .659366, atol=ATOL)
+    testing.assert_allclose(level.bounding_boxes(), [shape.bounds], atol=ATOL)
+    testing.assert_allclose(level.diameters(), unique_lw(shape)[-1], atol=ATOL)
+
+def test_aggregate_perimeters():
+    level = HullLevel.from_shapes(pieces)
+    testing.assert_raises(ValueError, level.aggregate, [1, 1, 1, 1],
+                          perimeters=[1, 2])
@@ -0,0 +1,89 @@
+from shapely import affinity, geometry
+from numpy import testing
+import numpy as np
+from .. import _geodesic as geo
+from ..compactness import *
+from .test_measures import shape, ATOL
+
+# a copy of the test shape about a kilometer across, sitting on the equator,
+# where its geodesic measures should be close to its planar measures
+small = affinity.scale(shape, .01, .01, origin=(0,0))
+multi = geometry.MultiPolygon([geometry.box(0,0,.01,.01),
+                               geometry.box(.02,0,.03,.01)])
+
+RTOL = .005
+
+def test_distance():
+    observed = geo.distance((0,0), (1,0))
+    testing.assert_allclose(observed, 111319.49, atol=1)
+    observed = geo.distance([(0,0), (0,0)], [(1,0), (0,1)])
+    testing.assert_allclose(observed, (111319.49, 110574.39), atol=1)
+
+def test_area():
+    observed = geo.area(geometry.box(0,0,1,1))
+    testing.assert_allclose(observed, 1.230878e10, rtol=1e-5)
+    observed = geo.perimeter(geometry.box(0,0,1,1))
+    testing.assert_allclose(observed, 443770.92, atol=1)
+
+def test_projection():
+    center = (5, 5)
+    for kind in ('aeqd', 'laea', 'gnom'):
+        planar = geo.project(small.exterior.coords, center, kind=kind)
+        observed = geo.unproject(planar, center, kind=kind)
+        testing.assert_allclose(observed, small.exterior.coords, atol=1e-7)
+
+def _relocate(poly, lon, lat):
+    """
+    move a shape near (0,0) to (lon, lat), stretching its longitudes so that
+    it keeps the same shape on the ground
+    """
+    moved = affinity.translate(poly, lon, lat)
+    return affinity.scale(moved, 1 / np.cos(np.radians(lat)), 1,
+                          origin=moved.centroid)
+
+def test_geodesic_measures():
+    for measure in (ipq, iaq, convex_hull, boundary_amplitude, reock,
+                    flaherty_crumplin_radius, flaherty_crumplin_lw):
+        observed = measure(small, geodesic=True)
+        testing.assert_allclose(observed, measure(shape), rtol=RTOL)
+
+def test_geodesic_moments():
+    # the moments are taken about the centroid, so a circle scores one
+    circle = geometry.Point(0,0).buffer(.01, 256)
+    testing.assert_allclose(nmi(circle, geodesic=True), 1, rtol=RTOL)
+    testing.assert_allclose(moa_ratio(circle, geodesic=True), 1, rtol=RTOL)
+    # and they do not depend on where the shape sits
+    for poly in (small, multi, circle):
+        for measure in (nmi, moa_ratio):
+            expected = measure(poly, geodesic=True)
+            for lon, lat in ((5, 5), (-100, 40)):
+                observed = measure(_relocate(poly, lon, lat), geodesic=True)
+                testing.assert_allclose(observed, expected, rtol=RTOL)
+
+def test_geodesic_multipolygon():
+    for measure in (reock, flaherty_crumplin_radius):
+        observed = measure(multi, geodesic=True)
+        testing.assert_allclose(observed, measure(multi), rtol=RTOL)
+
+def test_geodesic_hemisphere():
+    # a band 200 degrees wide, passing through the prime meridian
+    wide = geometry.Polygon([(-100,-10), (0,-10), (100,-10),
+                             (100,10), (0,10), (-100,10)])
+    for measure in (convex_hull, reock):
+        testing.assert_raises(ValueError, measure, wide, geodesic=True)
+
+def test_geodesic_antimeridian():
+    # the same box, once straddling the antimeridian and once the meridian
+    crossing = geometry.Polygon([(179,0), (179,1), (-179,1), (-179,0)])
+    straddling = geometry.Polygon([(-1,0), (-1,1), (1,1), (1,0)])
+    for measure in (ipq, convex_hull, reock, flaherty_crumplin_radius,
+                    moment_of_inertia):
+        observed = measure(crossing, geodesic=True)
+        testing.assert_allclose(observed, measure(straddling, geodesic=True),
+                                rtol=RTOL)
+    testing.assert_allclose(reock(crossing, geodesic=True), .508, atol=ATOL)
+
+def test_geodesic_moment_of_inertia():
+    observed = moment_of_inertia(small, geodesic=True)
+    testing.assert_allclose(observed, 111319.49 * moment_of_inertia(small),
+                            rtol=RTOL)